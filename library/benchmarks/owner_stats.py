@@ -0,0 +1,86 @@
+"""
+Owner dashboard statistics benchmark.
+
+Creates a throwaway test database with one owner holding 100k books and a
+relation per book, then times ``/api/v1/me/books/stats/`` cold (aggregate
+query) and warm (per-owner cache).
+
+Run from the project directory:
+
+    python benchmarks/owner_stats.py
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+BOOKS = 100000
+RUNS = 5
+BATCH_SIZE = 5000
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'library.settings')
+os.environ.setdefault('DJANGO_ALLOWED_HOSTS', 'testserver')
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.auth.models import User  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.test.utils import setup_test_environment, teardown_test_environment  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+from store.models import Book, UserBookRelation  # noqa: E402
+from store.stats import invalidate_owner_book_stats  # noqa: E402
+
+
+def populate():
+    owner = User.objects.create(username='owner')
+    User.objects.bulk_create([User(username=f'reader{i}') for i in range(100)])
+    readers = list(User.objects.filter(username__startswith='reader'))
+    Book.objects.bulk_create([Book(name=f'Book {i}', price=i % 500, author_name=f'Author {i % 1000}',
+                                   owner=owner) for i in range(BOOKS)], batch_size=BATCH_SIZE)
+    book_ids = Book.objects.filter(owner=owner).values_list('id', flat=True)
+    UserBookRelation.objects.bulk_create([
+        UserBookRelation(user=readers[i % len(readers)], book_id=book_id, like=i % 2 == 0,
+                         in_bookmarks=i % 3 == 0, rating=i % 5 + 1)
+        for i, book_id in enumerate(book_ids)
+    ], batch_size=BATCH_SIZE)
+    return owner
+
+
+def timed(client, url, owner, invalidate):
+    samples = []
+    for _ in range(RUNS):
+        if invalidate:
+            invalidate_owner_book_stats(owner.id)
+        started = time.perf_counter()
+        response = client.get(url)
+        samples.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.status_code
+    return min(samples), response.data
+
+
+def main():
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        owner = populate()
+        client = APIClient()
+        client.force_authenticate(owner)
+        url = reverse('owner-book-stats')
+
+        cold, data = timed(client, url, owner, invalidate=True)
+        warm, _ = timed(client, url, owner, invalidate=False)
+        print(f'stats for {BOOKS} books: {dict(data)}')
+        print(f'cold (aggregate query): {cold * 1000:.1f} ms')
+        print(f'warm (cached):          {warm * 1000:.1f} ms')
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+Worker cold-start benchmark.
+
+Compares the development and production settings profiles by running
+``python -X importtime`` on ``manage.py check`` and on the WSGI entry point,
+and by timing a fresh interpreter up to its first served request.
+
+Run from the project directory:
+
+    python benchmarks/startup.py
+"""
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+PROFILES = {
+    'development': {'DJANGO_DEBUG': '1', 'DJANGO_DEBUG_TOOLBAR': '1', 'DJANGO_SOCIAL_AUTH': '1'},
+    'production': {'DJANGO_DEBUG': '0', 'DJANGO_SOCIAL_AUTH': '0'},
+}
+
+TARGETS = {
+    'manage.py check': ['manage.py', 'check'],
+    'wsgi': ['-c', 'import library.wsgi'],
+    'first request': ['-c', (
+        'import library.wsgi\n'
+        'from django.test import Client\n'
+        'Client().get("/admin/login/")\n'
+    )],
+}
+
+RUNS = 5
+
+
+def run(args, profile):
+    env = dict(os.environ, DJANGO_SETTINGS_MODULE='library.settings',
+               DJANGO_ALLOWED_HOSTS='testserver', **PROFILES[profile])
+    started = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=BASE_DIR, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode:
+        raise RuntimeError(f'{args} failed for {profile} profile:\n{result.stderr[-2000:]}')
+    self_times = [line.split('|')[0].split(':')[1].strip() for line in result.stderr.splitlines()
+                  if line.startswith('import time:')]
+    self_times = [int(value) for value in self_times if value.isdigit()]
+    return elapsed, sum(self_times) / 1e6, len(self_times)
+
+
+def main():
+    print(f'{"target":<16} {"profile":<12} {"wall, s":>8} {"imports, s":>11} {"modules":>8}')
+    for target, args in TARGETS.items():
+        for profile in PROFILES:
+            samples = [run(args, profile) for _ in range(RUNS)]
+            wall = min(sample[0] for sample in samples)
+            imports = min(sample[1] for sample in samples)
+            modules = samples[0][2]
+            print(f'{target:<16} {profile:<12} {wall:>8.3f} {imports:>11.3f} {modules:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -13,7 +13,7 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
-import debug_toolbar
+from django.conf import settings
 from django.conf.urls import url
 from django.contrib import admin
 from django.urls import path, include
@@ -24,7 +24,17 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('api-auth/', include('rest_framework.urls')),
     path('api/v1/', include('store.urls')),
-    url('', include('social_django.urls', namespace='social')),
-    path('', auth),
-    path('debug/', include(debug_toolbar.urls)),
 ]
+
+if settings.SOCIAL_AUTH_ENABLED:
+    urlpatterns += [
+        url('', include('social_django.urls', namespace='social')),
+        path('', auth),
+    ]
+
+if settings.DEBUG_TOOLBAR:
+    import debug_toolbar
+
+    urlpatterns += [
+        path('debug/', include(debug_toolbar.urls)),
+    ]
@@ -4,13 +4,57 @@ from django.contrib import admin
 from django.contrib.admin import ModelAdmin
 
 from store.models import Book, UserBookRelation
+from store.paginators import EstimatedCountPaginator
+from store.stats import invalidate_owner_book_stats
 
 
 @admin.register(Book)
 class BookAdmin(ModelAdmin):
-    pass
+    list_display = ('id', 'name', 'author_name', 'price', 'owner')
+    list_select_related = ('owner',)
+    raw_id_fields = ('owner',)
+    search_fields = ('name', 'author_name')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(UserBookRelation)
-class BookAdmin(ModelAdmin):
-    pass
+class UserBookRelationAdmin(ModelAdmin):
+    list_display = ('id', 'user', 'book', 'like', 'in_bookmarks', 'rating')
+    list_select_related = ('user', 'book')
+    list_filter = ('like', 'rating')
+    autocomplete_fields = ('user', 'book')
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    actions = ('mark_liked', 'mark_unliked', 'add_to_bookmarks', 'remove_from_bookmarks')
+
+    def delete_model(self, request, obj):
+        super().delete_model(request, obj)
+        invalidate_owner_book_stats(obj.book.owner_id)
+
+    def delete_queryset(self, request, queryset):
+        owner_ids = set(queryset.values_list('book__owner_id', flat=True).distinct())
+        super().delete_queryset(request, queryset)
+        invalidate_owner_book_stats(*owner_ids)
+
+    def _update(self, request, queryset, **fields):
+        owner_ids = set(queryset.values_list('book__owner_id', flat=True).distinct())
+        updated = queryset.update(**fields)
+        invalidate_owner_book_stats(*owner_ids)
+        self.message_user(request, f'Updated relations: {updated}')
+
+    @admin.action(description='Mark selected relations as liked')
+    def mark_liked(self, request, queryset):
+        self._update(request, queryset, like=True)
+
+    @admin.action(description='Mark selected relations as not liked')
+    def mark_unliked(self, request, queryset):
+        self._update(request, queryset, like=False)
+
+    @admin.action(description='Add selected relations to bookmarks')
+    def add_to_bookmarks(self, request, queryset):
+        self._update(request, queryset, in_bookmarks=True)
+
+    @admin.action(description='Remove selected relations from bookmarks')
+    def remove_from_bookmarks(self, request, queryset):
+        self._update(request, queryset, in_bookmarks=False)
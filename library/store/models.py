@@ -9,6 +9,18 @@ class Book(models.Model):
     owner = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, related_name='my_books')
     readers = models.ManyToManyField(User, through='UserBookRelation', related_name='books')
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored owner so an owner change can be detected on save without a query.
+        instance._loaded_owner_id = instance.__dict__.get('owner_id')
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        if fields is None or 'owner' in fields or 'owner_id' in fields:
+            self._loaded_owner_id = self.owner_id
+
     def __str__(self):
         return f'Id {self.id}: {self.name}'
 
@@ -25,9 +37,9 @@ class UserBookRelation(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     book = models.ForeignKey(Book, on_delete=models.CASCADE)
-    like = models.BooleanField(default=False)
+    like = models.BooleanField(default=False, db_index=True)
     in_bookmarks = models.BooleanField(default=False)
-    rating = models.PositiveSmallIntegerField(choices=RATING_CHOICES, null=True)
+    rating = models.PositiveSmallIntegerField(choices=RATING_CHOICES, null=True, db_index=True)
 
     def __str__(self):
         return f'User: {self.user.username}, book: {self.book.name}, rating: {self.rating}'
@@ -0,0 +1,48 @@
+from django.core.paginator import Paginator, EmptyPage
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that takes the row count of an unfiltered queryset from
+    PostgreSQL planner statistics instead of running COUNT(*) over the whole table.
+
+    The estimate can be off in either direction, so page numbers past the
+    estimated last page are accepted and simply return what is really there,
+    possibly nothing, instead of raising EmptyPage.
+    """
+    estimate_threshold = 10000
+    count_is_estimated = False
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is not None and estimate > self.estimate_threshold:
+            self.count_is_estimated = True
+            return estimate
+        return super().count
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if self.count_is_estimated and int(number) > 1:
+                return int(number)
+            raise
+
+    def _estimated_count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is None or query.where or query.distinct:
+            return None
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+                           [connection.ops.quote_name(queryset.model._meta.db_table)])
+            row = cursor.fetchone()
+        if row is None or row[0] < 0:
+            return None
+        return int(row[0])
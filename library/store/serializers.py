@@ -32,3 +32,11 @@ class UserBookRelationSerializer(ModelSerializer):
     class Meta:
         model = UserBookRelation
         fields = ('book', 'like', 'in_bookmarks', 'rating')
+
+
+class OwnerBookStatsSerializer(serializers.Serializer):
+    books = serializers.IntegerField(read_only=True)
+    likes = serializers.IntegerField(read_only=True)
+    rating = serializers.DecimalField(max_digits=3, decimal_places=2, read_only=True)
+    bookmarks = serializers.IntegerField(read_only=True)
+    readers = serializers.IntegerField(read_only=True)
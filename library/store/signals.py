@@ -0,0 +1,33 @@
+from django.contrib.auth.models import User
+from django.db.models.signals import pre_delete, post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Book, UserBookRelation
+from .stats import invalidate_owner_book_stats
+
+# Relations deliberately have no delete receivers: those would turn off the fast
+# cascade delete of relations when a book or user is removed. Deletions are
+# invalidated from the Book and User side, and in the admin.
+
+
+@receiver(post_save, sender=UserBookRelation)
+def relation_saved(sender, instance, **kwargs):
+    # UserBooksRelationView loads the book together with the relation, so this is query free.
+    invalidate_owner_book_stats(instance.book.owner_id)
+
+
+@receiver(post_save, sender=Book)
+def book_saved(sender, instance, **kwargs):
+    invalidate_owner_book_stats(instance.owner_id, getattr(instance, '_loaded_owner_id', None))
+    instance._loaded_owner_id = instance.owner_id
+
+
+@receiver(post_delete, sender=Book)
+def book_deleted(sender, instance, **kwargs):
+    invalidate_owner_book_stats(instance.owner_id)
+
+
+@receiver(pre_delete, sender=User)
+def reader_deleting(sender, instance, **kwargs):
+    owner_ids = Book.objects.filter(userbookrelation__user=instance).values_list('owner_id', flat=True)
+    invalidate_owner_book_stats(*set(owner_ids))
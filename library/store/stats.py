@@ -0,0 +1,78 @@
+"""
+Per-owner book statistics for the owner dashboard.
+
+Cached figures live under a key that includes a per-owner version. Writes
+replace the version once their transaction commits, so figures computed from
+data read before a write are stored under a version nobody asks for anymore.
+
+Only the paths in store.signals and store.admin replace the version. Writes
+that bypass model signals, such as QuerySet.update(), bulk_create() and
+UserBookRelation.delete() outside of the admin, leave the cached figures stale
+until OWNER_BOOK_STATS_TIMEOUT expires.
+
+A cache outage never breaks a write or the endpoint: failures are logged and
+the figures are computed from the database.
+"""
+import logging
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Avg, Q
+
+from .models import Book
+
+logger = logging.getLogger(__name__)
+
+OWNER_BOOK_STATS_KEY = 'store:owner-book-stats:{}:{}'
+OWNER_BOOK_STATS_VERSION_KEY = 'store:owner-book-stats-version:{}'
+OWNER_BOOK_STATS_TIMEOUT = 5 * 60
+
+
+def _stats_key(owner_id):
+    version_key = OWNER_BOOK_STATS_VERSION_KEY.format(owner_id)
+    version = cache.get(version_key)
+    if version is None:
+        cache.add(version_key, uuid4().hex, None)
+        version = cache.get(version_key)
+    return OWNER_BOOK_STATS_KEY.format(owner_id, version)
+
+
+def _aggregate_owner_book_stats(owner_id):
+    return Book.objects.filter(owner_id=owner_id).aggregate(
+        books=Count('id', distinct=True),
+        likes=Count('userbookrelation', filter=Q(userbookrelation__like=True)),
+        rating=Avg('userbookrelation__rating'),
+        bookmarks=Count('userbookrelation', filter=Q(userbookrelation__in_bookmarks=True)),
+        readers=Count('userbookrelation__user', distinct=True),
+    )
+
+
+def get_owner_book_stats(owner_id):
+    try:
+        key = _stats_key(owner_id)
+        stats = cache.get(key)
+    except Exception:
+        logger.exception('Could not read book stats of owner %s from cache', owner_id)
+        return _aggregate_owner_book_stats(owner_id)
+    if stats is None:
+        stats = _aggregate_owner_book_stats(owner_id)
+        try:
+            cache.set(key, stats, OWNER_BOOK_STATS_TIMEOUT)
+        except Exception:
+            logger.exception('Could not store book stats of owner %s in cache', owner_id)
+    return stats
+
+
+def _replace_versions(owner_ids):
+    try:
+        cache.set_many({OWNER_BOOK_STATS_VERSION_KEY.format(owner_id): uuid4().hex
+                        for owner_id in owner_ids}, None)
+    except Exception:
+        logger.exception('Could not invalidate book stats of owners %s', sorted(owner_ids))
+
+
+def invalidate_owner_book_stats(*owner_ids):
+    owner_ids = {owner_id for owner_id in owner_ids if owner_id is not None}
+    if owner_ids:
+        transaction.on_commit(lambda: _replace_versions(owner_ids))
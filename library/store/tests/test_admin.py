@@ -0,0 +1,144 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.paginator import EmptyPage
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from store.models import Book, UserBookRelation
+from store.paginators import EstimatedCountPaginator
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class UserBookRelationAdminTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.admin = User.objects.create_superuser(username='admin', password='admin')
+        self.book_1 = Book.objects.create(name='Test Book 1', price=25,
+                                          author_name='Author 1', owner=self.admin)
+        self.book_2 = Book.objects.create(name='Test Book 2', price=50,
+                                          author_name='Author 2', owner=self.admin)
+        self.client.force_login(self.admin)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        url = reverse('admin:store_userbookrelation_changelist')
+        UserBookRelation.objects.create(user=self.admin, book=self.book_1)
+        with CaptureQueriesContext(connection) as queries_one:
+            response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+
+        for i in range(5):
+            user = User.objects.create(username=f'user{i}')
+            UserBookRelation.objects.create(user=user, book=self.book_2)
+        with CaptureQueriesContext(connection) as queries_many:
+            response = self.client.get(url)
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(len(queries_one), len(queries_many))
+
+    def test_mark_liked_action(self):
+        relation_1 = UserBookRelation.objects.create(user=self.admin, book=self.book_1)
+        relation_2 = UserBookRelation.objects.create(user=self.admin, book=self.book_2)
+        url = reverse('admin:store_userbookrelation_changelist')
+        data = {
+            'action': 'mark_liked',
+            '_selected_action': [relation_1.id, relation_2.id],
+        }
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(url, data)
+        self.assertEqual(302, response.status_code)
+        updates = [q for q in queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(1, len(updates))
+        self.assertEqual(2, UserBookRelation.objects.filter(like=True).count())
+
+    def test_actions_invalidate_owner_book_stats(self):
+        relation = UserBookRelation.objects.create(user=self.admin, book=self.book_1)
+        url = reverse('admin:store_userbookrelation_changelist')
+        stats_url = reverse('owner-book-stats')
+        cache.clear()
+        self.assertEqual(0, self.client.get(stats_url).data['likes'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, {'action': 'mark_liked', '_selected_action': [relation.id]})
+        self.assertEqual(1, self.client.get(stats_url).data['likes'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post(url, {'action': 'delete_selected', '_selected_action': [relation.id],
+                                   'post': 'yes'})
+        self.assertFalse(UserBookRelation.objects.exists())
+        self.assertEqual(0, self.client.get(stats_url).data['likes'])
+
+    def test_paginator_falls_back_to_exact_count(self):
+        UserBookRelation.objects.create(user=self.admin, book=self.book_1)
+        paginator = EstimatedCountPaginator(UserBookRelation.objects.order_by('id'), 100)
+        self.assertEqual(1, paginator.count)
+
+
+class EstimatedCountPaginatorTestCase(TestCase):
+
+    def setUp(self) -> None:
+        self.user = User.objects.create(username='test_username')
+        self.book_1 = Book.objects.create(name='Test Book 1', price=25,
+                                          author_name='Author 1', owner=self.user)
+        UserBookRelation.objects.create(user=self.user, book=self.book_1, like=True)
+
+    def mock_postgresql(self, reltuples):
+        cursor = mock.MagicMock()
+        cursor.fetchone.return_value = (reltuples,)
+        postgresql = mock.MagicMock(vendor='postgresql')
+        postgresql.ops.quote_name.side_effect = lambda name: f'"{name}"'
+        postgresql.cursor.return_value.__enter__.return_value = cursor
+        patcher = mock.patch('store.paginators.connections', {'default': postgresql})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return cursor
+
+    def test_estimate_above_threshold(self):
+        cursor = self.mock_postgresql(2500000.0)
+        paginator = EstimatedCountPaginator(UserBookRelation.objects.order_by('id'), 100)
+        self.assertEqual(2500000, paginator.count)
+        cursor.execute.assert_called_once_with(
+            'SELECT reltuples FROM pg_class WHERE oid = %s::regclass',
+            ['"store_userbookrelation"'])
+
+    def test_estimate_below_threshold(self):
+        self.mock_postgresql(50.0)
+        paginator = EstimatedCountPaginator(UserBookRelation.objects.order_by('id'), 100)
+        self.assertEqual(1, paginator.count)
+
+    def test_filtered_queryset_uses_exact_count(self):
+        cursor = self.mock_postgresql(2500000.0)
+        queryset = UserBookRelation.objects.filter(like=True).order_by('id')
+        paginator = EstimatedCountPaginator(queryset, 100)
+        self.assertEqual(1, paginator.count)
+        cursor.execute.assert_not_called()
+
+    def test_table_never_analysed_uses_exact_count(self):
+        self.mock_postgresql(-1.0)
+        paginator = EstimatedCountPaginator(UserBookRelation.objects.order_by('id'), 100)
+        self.assertEqual(1, paginator.count)
+
+    def test_last_estimated_page_is_empty(self):
+        self.mock_postgresql(2500000.0)
+        paginator = EstimatedCountPaginator(UserBookRelation.objects.order_by('id'), 100)
+        self.assertEqual(25000, paginator.num_pages)
+        self.assertEqual([], list(paginator.page(25000).object_list))
+        self.assertEqual([], list(paginator.page(25001).object_list))
+        self.assertFalse(paginator.page(25001).has_next())
+
+    def test_page_past_exact_count_still_raises(self):
+        paginator = EstimatedCountPaginator(UserBookRelation.objects.order_by('id'), 100)
+        with self.assertRaises(EmptyPage):
+            paginator.page(2)
+        with self.assertRaises(EmptyPage):
+            paginator.page(0)
+
+    def test_changelist_page_past_estimate(self):
+        self.mock_postgresql(2500000.0)
+        admin = User.objects.create_superuser(username='admin', password='admin')
+        self.client.force_login(admin)
+        url = reverse('admin:store_userbookrelation_changelist')
+        response = self.client.get(url, {'p': 25001})
+        self.assertEqual(200, response.status_code)
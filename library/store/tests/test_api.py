@@ -1,7 +1,12 @@
 import json
+from unittest import mock
 
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
 from django.db.models import Count, Case, When, Avg
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework import status
 from rest_framework.exceptions import ErrorDetail
@@ -9,6 +14,7 @@ from rest_framework.test import APITestCase
 
 from store.models import Book, UserBookRelation
 from store.serializers import BooksSerializer
+from store.stats import get_owner_book_stats
 
 
 class BooksApiTestCase(APITestCase):
@@ -227,3 +233,175 @@ class BooksRelationTestCase(APITestCase):
         self.assertEqual(status.HTTP_400_BAD_REQUEST, response.status_code, response.data)
 
 
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class OwnerBookStatsTestCase(APITestCase):
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create(username='test_username')
+        self.user2 = User.objects.create(username='test_username2')
+        self.book_1 = Book.objects.create(name='Test Book 1', price=50,
+                                          author_name='Author 1', owner=self.user)
+        self.book_2 = Book.objects.create(name='Test Book 2', price=25,
+                                          author_name='Author 2', owner=self.user)
+        self.book_3 = Book.objects.create(name='Test Book 3', price=75,
+                                          author_name='Author 3', owner=self.user2)
+
+        UserBookRelation.objects.create(user=self.user, book=self.book_1, like=True, rating=5)
+        UserBookRelation.objects.create(user=self.user2, book=self.book_1, like=True,
+                                        in_bookmarks=True, rating=2)
+        UserBookRelation.objects.create(user=self.user2, book=self.book_2, in_bookmarks=True)
+        UserBookRelation.objects.create(user=self.user, book=self.book_3, like=True, rating=1)
+
+    def test_get(self):
+        url = reverse('owner-book-stats')
+        self.client.force_login(self.user)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(1, len([q for q in queries if 'store_userbookrelation' in q['sql']]))
+        expected_data = {
+            'books': 2,
+            'likes': 2,
+            'rating': '3.50',
+            'bookmarks': 2,
+            'readers': 2,
+        }
+        self.assertEqual(expected_data, response.data)
+
+    def test_get_without_books(self):
+        url = reverse('owner-book-stats')
+        user = User.objects.create(username='test_username3')
+        self.client.force_login(user)
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        expected_data = {
+            'books': 0,
+            'likes': 0,
+            'rating': None,
+            'bookmarks': 0,
+            'readers': 0,
+        }
+        self.assertEqual(expected_data, response.data)
+
+    def test_get_not_authenticated(self):
+        url = reverse('owner-book-stats')
+        response = self.client.get(url)
+        self.assertEqual(status.HTTP_403_FORBIDDEN, response.status_code)
+
+    def test_cache_invalidated_on_relation_write(self):
+        url = reverse('owner-book-stats')
+        self.client.force_login(self.user)
+        self.assertEqual(2, self.client.get(url).data['likes'])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(url)
+        self.assertEqual(0, len([q for q in queries if 'store_userbookrelation' in q['sql']]))
+
+        relation_url = reverse('userbookrelation-detail', args=(self.book_2.id,))
+        self.client.force_login(self.user2)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.patch(relation_url, data=json.dumps({'like': True}),
+                                         content_type='application/json')
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+
+        self.client.force_login(self.user)
+        self.assertEqual(3, self.client.get(url).data['likes'])
+
+    def test_cache_invalidated_on_book_delete(self):
+        url = reverse('owner-book-stats')
+        self.client.force_login(self.user)
+        self.assertEqual(2, self.client.get(url).data['books'])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.book_1.delete()
+
+        expected_data = {
+            'books': 1,
+            'likes': 0,
+            'rating': None,
+            'bookmarks': 1,
+            'readers': 1,
+        }
+        self.assertEqual(expected_data, self.client.get(url).data)
+
+    def test_cache_invalidated_on_owner_change(self):
+        url = reverse('owner-book-stats')
+        self.client.force_login(self.user)
+        self.assertEqual(2, self.client.get(url).data['books'])
+        self.client.force_login(self.user2)
+        self.assertEqual(1, self.client.get(url).data['books'])
+
+        book = Book.objects.get(id=self.book_1.id)
+        book.owner = self.user2
+        with self.captureOnCommitCallbacks(execute=True):
+            book.save()
+
+        self.assertEqual(2, self.client.get(url).data['books'])
+        self.client.force_login(self.user)
+        self.assertEqual(1, self.client.get(url).data['books'])
+
+    def test_cache_invalidated_on_owner_change_after_refresh(self):
+        user3 = User.objects.create(username='test_username3')
+        book = Book.objects.get(id=self.book_1.id)
+        Book.objects.filter(id=self.book_1.id).update(owner=self.user2)
+        book.refresh_from_db()
+        url = reverse('owner-book-stats')
+        self.client.force_login(self.user2)
+        self.assertEqual(2, self.client.get(url).data['books'])
+
+        book.owner = user3
+        with self.captureOnCommitCallbacks(execute=True):
+            book.save()
+
+        self.assertEqual(1, self.client.get(url).data['books'])
+
+    def test_stats_computed_during_write_are_not_served(self):
+        url = reverse('owner-book-stats')
+        self.client.force_login(self.user)
+        set_stats = cache.set
+        relation = UserBookRelation.objects.get(user=self.user2, book=self.book_2)
+
+        def write_then_set(key, value, *args, **kwargs):
+            # A like lands after the aggregate query but before its result is cached.
+            if not relation.like:
+                relation.like = True
+                with self.captureOnCommitCallbacks(execute=True):
+                    relation.save()
+            set_stats(key, value, *args, **kwargs)
+
+        with mock.patch('store.stats.cache.set', side_effect=write_then_set):
+            self.assertEqual(2, self.client.get(url).data['likes'])
+        self.assertEqual(3, self.client.get(url).data['likes'])
+
+    def test_cache_outage_does_not_break_writes(self):
+        url = reverse('owner-book-stats')
+        self.client.force_login(self.user)
+        outage = ConnectionRefusedError(111, 'Connection refused')
+        with mock.patch('store.stats.cache.set_many', side_effect=outage), \
+                mock.patch('store.stats.cache.get', side_effect=outage), \
+                self.assertLogs('store.stats', level='ERROR'):
+            with self.captureOnCommitCallbacks(execute=True):
+                self.book_2.name = 'New name'
+                self.book_2.save()
+            response = self.client.get(url)
+        self.assertEqual(status.HTTP_200_OK, response.status_code)
+        self.assertEqual(2, response.data['books'])
+
+    def test_book_save_without_owner_change(self):
+        book = Book.objects.get(id=self.book_1.id)
+        book.name = 'New name'
+        with CaptureQueriesContext(connection) as queries:
+            book.save()
+        self.assertEqual(1, len(queries))
+
+    def test_book_delete_queries_do_not_grow_with_relations(self):
+        with CaptureQueriesContext(connection) as queries_few:
+            Book.objects.get(id=self.book_2.id).delete()
+
+        for i in range(10):
+            user = User.objects.create(username=f'reader{i}')
+            UserBookRelation.objects.create(user=user, book=self.book_1, like=True)
+        with CaptureQueriesContext(connection) as queries_many:
+            Book.objects.get(id=self.book_1.id).delete()
+        self.assertEqual(len(queries_few), len(queries_many))
@@ -2,14 +2,16 @@ from django.urls import path
 
 from rest_framework.routers import SimpleRouter
 
-from .views import BookViewSet, auth, UserBooksRelationView
+from .views import BookViewSet, auth, UserBooksRelationView, OwnerBookStatsView
 
 router = SimpleRouter()
 
 router.register(r'book', BookViewSet)
 router.register(r'book-relation', UserBooksRelationView)
 
-urlpatterns = []
+urlpatterns = [
+    path('me/books/stats/', OwnerBookStatsView.as_view(), name='owner-book-stats'),
+]
 
 urlpatterns += router.urls
 
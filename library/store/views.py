@@ -4,11 +4,14 @@ from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import mixins
 from rest_framework.filters import SearchFilter, OrderingFilter
 from rest_framework.permissions import IsAuthenticated, IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.views import APIView
 from rest_framework.viewsets import ModelViewSet, GenericViewSet
 
 from .models import Book, UserBookRelation
 from .permissions import IsOwnerOrStaffOrReadOnly
-from .serializers import BooksSerializer, UserBookRelationSerializer
+from .serializers import BooksSerializer, UserBookRelationSerializer, OwnerBookStatsSerializer
+from .stats import get_owner_book_stats
 
 
 class BookViewSet(ModelViewSet):
@@ -35,11 +38,19 @@ class UserBooksRelationView(mixins.UpdateModelMixin, GenericViewSet):
     lookup_field = 'book'
 
     def get_object(self):
-        obj, created = UserBookRelation.objects.get_or_create(user=self.request.user,
-                                                        book_id=self.kwargs['book'])
+        obj, created = UserBookRelation.objects.select_related('book').get_or_create(
+            user=self.request.user, book_id=self.kwargs['book'])
         print(created)
         return obj
 
 
+class OwnerBookStatsView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        stats = get_owner_book_stats(request.user.id)
+        return Response(OwnerBookStatsSerializer(stats).data)
+
+
 def auth(request):
     return render(request, 'OAuth.html')